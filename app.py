@@ -9,6 +9,8 @@ import random
 import json
 from typing import Dict, List
 
+from cs_analytics import CSAnalyticsAggregator
+
 # Configure page
 st.set_page_config(
     page_title="Intelligent Risk Platform",
@@ -131,6 +133,19 @@ class MockDataGenerator:
             "I forgot my password"
         ]
         
+        intents = [
+            "account_access",
+            "order_status",
+            "returns",
+            "technical_issue",
+            "billing",
+            "payment_update",
+            "order_tracking",
+            "subscription",
+            "damaged_product",
+            "account_access"
+        ]
+        
         responses = [
             "I understand you're having trouble logging in. Let me help you reset your password.",
             "I apologize for the delay with your order. Let me check the status for you.",
@@ -150,6 +165,7 @@ class MockDataGenerator:
         
         return {
             "query": queries[query_idx],
+            "intent": intents[query_idx],
             "response": responses[query_idx],
             "response_time": round(response_time, 2),
             "confidence_score": round(confidence, 3),
@@ -228,8 +244,13 @@ def main():
     # Initialize session state
     if 'fraud_predictions' not in st.session_state:
         st.session_state.fraud_predictions = []
-    if 'cs_interactions' not in st.session_state:
-        st.session_state.cs_interactions = []
+    if 'cs_analytics' not in st.session_state:
+        # Sessions started before the aggregator existed keep a raw interaction
+        # list; fold it in once and drop it so memory stays bounded
+        cs_analytics = CSAnalyticsAggregator()
+        for interaction in st.session_state.pop('cs_interactions', []):
+            cs_analytics.add(interaction)
+        st.session_state.cs_analytics = cs_analytics
     
     if demo_type == "Dashboard Overview":
         show_dashboard_overview()
@@ -424,7 +445,7 @@ def show_customer_service_demo():
         with col_a:
             if st.button("🎲 Generate Sample Query", type="secondary"):
                 interaction = MockDataGenerator.generate_customer_service_query()
-                st.session_state.cs_interactions.append(interaction)
+                st.session_state.cs_analytics.add(interaction)
                 
                 st.text_area("Customer Query:", value=interaction["query"], height=100, disabled=True)
                 st.text_area("AI Response:", value=interaction["response"], height=150, disabled=True)
@@ -481,32 +502,37 @@ def show_customer_service_demo():
     with col2:
         st.subheader("Performance Analytics")
         
-        if st.session_state.cs_interactions:
-            df = pd.DataFrame(st.session_state.cs_interactions)
-            
-            # Performance metrics
-            avg_response_time = df['response_time'].mean()
-            avg_confidence = df['confidence_score'].mean()
-            satisfaction_rate = df['user_satisfied'].mean()
-            total_interactions = len(df)
+        analytics = st.session_state.cs_analytics
+        if len(analytics):
+            overall = analytics.overall_summary()
             
             col_a, col_b = st.columns(2)
             with col_a:
-                st.metric("Total Interactions", total_interactions)
-                st.metric("Avg Response Time", f"{avg_response_time:.1f}s")
+                st.metric("Total Interactions", overall["count"])
+                st.metric("Avg Response Time", f"{overall['avg_response_time']:.1f}s")
+                st.metric("P95 Response Time (≤)", f"{overall['p95_response_time']:.1f}s",
+                          help="Upper edge of the 0.1s bin holding the 95th percentile, capped at 6.0s")
             with col_b:
-                st.metric("Satisfaction Rate", f"{satisfaction_rate:.1%}")
-                st.metric("Avg Confidence", f"{avg_confidence:.1%}")
+                st.metric("Satisfaction Rate", f"{overall['satisfaction_rate']:.1%}")
+                st.metric("Avg Confidence", f"{overall['avg_confidence']:.1%}")
             
-            # Response time chart
-            fig = px.line(df.reset_index(), x='index', y='response_time', 
-                         title="Response Time Trend")
+            # Response time per minute window
+            window_df = pd.DataFrame(analytics.window_summary())
+            fig = px.line(window_df, x='window', y=['avg_response_time', 'p95_response_time'],
+                         markers=True,
+                         title="Response Time Trend (per active minute, idle gaps joined)")
             fig.update_layout(height=250)
             st.plotly_chart(fig, use_container_width=True)
             
+            # Breakdown by query type
+            st.subheader("By Query Type")
+            intent_df = pd.DataFrame(analytics.intent_summary())
+            st.dataframe(intent_df.round(3), use_container_width=True)
+            
             # Recent interactions
             st.subheader("Recent Interactions")
-            recent_df = df.tail(3)[['query', 'response_time', 'confidence_score', 'user_satisfied']]
+            recent_df = pd.DataFrame(list(analytics.recent)).reindex(
+                columns=['query', 'intent', 'response_time', 'confidence_score', 'user_satisfied'])
             st.dataframe(recent_df, use_container_width=True)
         else:
             st.info("Generate some interactions to see analytics")
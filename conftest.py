@@ -0,0 +1,2 @@
+# Presence of this file puts the repo root on sys.path so tests can import
+# top-level modules such as cs_analytics under a plain `pytest` run.
@@ -0,0 +1,114 @@
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+class CSAnalyticsAggregator:
+    """Incrementally maintained customer service rollups by intent and minute
+    
+    p95 response time is read from a fixed-width histogram, so it is reported as
+    the upper edge of the 0.1s bin holding the 95th percentile. Bins are
+    half-open ([1.0s, 1.1s) reports 1.1s) and anything over 5.9s is clamped to 6.0s.
+    """
+    
+    RESPONSE_TIME_BIN_WIDTH = 0.1
+    RESPONSE_TIME_BINS = 60
+    
+    def __init__(self, max_windows: int = 60, max_recent: int = 3):
+        self.max_windows = max_windows
+        self.recent = deque(maxlen=max_recent)
+        self.overall = self._new_bucket()
+        self.by_intent: Dict[str, Dict] = {}
+        self.by_minute: Dict[datetime, Dict] = {}
+    
+    @classmethod
+    def _new_bucket(cls) -> Dict:
+        return {
+            "count": 0,
+            "response_time_sum": 0.0,
+            "confidence_sum": 0.0,
+            "satisfied_count": 0,
+            "response_time_hist": [0] * cls.RESPONSE_TIME_BINS
+        }
+    
+    @classmethod
+    def _update_bucket(cls, bucket: Dict, interaction: Dict):
+        response_time = interaction["response_time"]
+        bucket["count"] += 1
+        bucket["response_time_sum"] += response_time
+        bucket["confidence_sum"] += interaction["confidence_score"]
+        bucket["satisfied_count"] += int(interaction["user_satisfied"])
+        # Round the quotient first so values on a bin edge always open the next bin
+        bin_idx = int(round(response_time / cls.RESPONSE_TIME_BIN_WIDTH, 6))
+        bin_idx = min(bin_idx, cls.RESPONSE_TIME_BINS - 1)
+        bucket["response_time_hist"][bin_idx] += 1
+    
+    @classmethod
+    def _summarize(cls, bucket: Dict) -> Dict:
+        """Turn a raw bucket into display metrics"""
+        count = bucket["count"]
+        
+        # p95 is the upper edge of the bin containing the 95th percentile
+        target = 0.95 * count
+        cumulative = 0
+        p95 = 0.0
+        for bin_idx, bin_count in enumerate(bucket["response_time_hist"]):
+            cumulative += bin_count
+            if cumulative >= target:
+                p95 = (bin_idx + 1) * cls.RESPONSE_TIME_BIN_WIDTH
+                break
+        
+        return {
+            "count": count,
+            "avg_response_time": bucket["response_time_sum"] / count,
+            "p95_response_time": round(p95, 2),
+            "avg_confidence": bucket["confidence_sum"] / count,
+            "satisfaction_rate": bucket["satisfied_count"] / count
+        }
+    
+    def add(self, interaction: Dict, recorded_at: Optional[datetime] = None):
+        """Record an interaction in the recent buffer and the overall, intent and minute rollups
+        
+        Minute windows are keyed on when the interaction was recorded (now by
+        default), not on its own timestamp, so the trend follows arrival order.
+        """
+        intent = interaction.get("intent", "other")
+        minute = (recorded_at or datetime.now()).replace(second=0, microsecond=0)
+        
+        if intent not in self.by_intent:
+            self.by_intent[intent] = self._new_bucket()
+        
+        self.recent.append(interaction)
+        self._update_bucket(self.overall, interaction)
+        self._update_bucket(self.by_intent[intent], interaction)
+        
+        # A minute older than every kept window would be evicted straight away;
+        # it still counts towards the overall and intent rollups
+        if (minute not in self.by_minute and len(self.by_minute) >= self.max_windows
+                and minute < min(self.by_minute)):
+            return
+        
+        if minute not in self.by_minute:
+            self.by_minute[minute] = self._new_bucket()
+        self._update_bucket(self.by_minute[minute], interaction)
+        
+        # Keep only the most recent windows so memory stays bounded
+        if len(self.by_minute) > self.max_windows:
+            del self.by_minute[min(self.by_minute)]
+    
+    def __len__(self) -> int:
+        return self.overall["count"]
+    
+    def overall_summary(self) -> Dict:
+        return self._summarize(self.overall)
+    
+    def intent_summary(self) -> List[Dict]:
+        return [
+            {"intent": intent, **self._summarize(bucket)}
+            for intent, bucket in sorted(self.by_intent.items())
+        ]
+    
+    def window_summary(self) -> List[Dict]:
+        return [
+            {"window": minute, **self._summarize(bucket)}
+            for minute, bucket in sorted(self.by_minute.items())
+        ]
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from cs_analytics import CSAnalyticsAggregator
+
+START = datetime(2026, 1, 1, 12, 0)
+
+
+def make_interaction(response_time, confidence=0.9, satisfied=True, intent="billing"):
+    return {
+        "query": "I was charged twice for the same order",
+        "intent": intent,
+        "response_time": response_time,
+        "confidence_score": confidence,
+        "user_satisfied": satisfied,
+    }
+
+
+def test_overall_summary():
+    agg = CSAnalyticsAggregator()
+    agg.add(make_interaction(1.0, confidence=0.8, satisfied=True), recorded_at=START)
+    agg.add(make_interaction(2.0, confidence=0.9, satisfied=False), recorded_at=START)
+    agg.add(make_interaction(3.0, confidence=1.0, satisfied=True), recorded_at=START)
+    agg.add(make_interaction(2.0, confidence=0.9, satisfied=True), recorded_at=START)
+
+    summary = agg.overall_summary()
+    assert summary["count"] == 4
+    assert summary["avg_response_time"] == pytest.approx(2.0)
+    assert summary["avg_confidence"] == pytest.approx(0.9)
+    assert summary["satisfaction_rate"] == pytest.approx(0.75)
+    assert summary["p95_response_time"] == pytest.approx(3.1)
+
+
+def test_p95_uses_bin_upper_edge():
+    agg = CSAnalyticsAggregator()
+    for _ in range(19):
+        agg.add(make_interaction(0.52), recorded_at=START)
+    agg.add(make_interaction(2.47), recorded_at=START)
+
+    assert agg.overall_summary()["p95_response_time"] == pytest.approx(0.6)
+
+
+@pytest.mark.parametrize("response_time, expected", [
+    (0.3, 0.4),
+    (0.6, 0.7),
+    (0.7, 0.8),
+    (1.0, 1.1),
+    (2.9, 3.0),
+])
+def test_p95_bin_edge_values_open_next_bin(response_time, expected):
+    agg = CSAnalyticsAggregator()
+    agg.add(make_interaction(response_time), recorded_at=START)
+
+    assert agg.overall_summary()["p95_response_time"] == pytest.approx(expected)
+
+
+def test_p95_clamps_to_last_bin():
+    agg = CSAnalyticsAggregator()
+    agg.add(make_interaction(12.5), recorded_at=START)
+
+    assert agg.overall_summary()["p95_response_time"] == pytest.approx(6.0)
+
+
+def test_intent_summary_groups_by_intent():
+    agg = CSAnalyticsAggregator()
+    agg.add(make_interaction(1.0, intent="billing"), recorded_at=START)
+    agg.add(make_interaction(3.0, intent="billing", satisfied=False), recorded_at=START)
+    agg.add(make_interaction(2.0, intent="returns"), recorded_at=START)
+    agg.add({k: v for k, v in make_interaction(1.5).items() if k != "intent"}, recorded_at=START)
+
+    summary = {row["intent"]: row for row in agg.intent_summary()}
+    assert list(summary) == ["billing", "other", "returns"]
+    assert summary["billing"]["count"] == 2
+    assert summary["billing"]["avg_response_time"] == pytest.approx(2.0)
+    assert summary["billing"]["satisfaction_rate"] == pytest.approx(0.5)
+    assert summary["returns"]["count"] == 1
+
+
+def test_windows_follow_record_time():
+    agg = CSAnalyticsAggregator()
+    agg.add(make_interaction(1.0), recorded_at=START + timedelta(seconds=10))
+    agg.add(make_interaction(2.0), recorded_at=START + timedelta(seconds=50))
+    agg.add(make_interaction(3.0), recorded_at=START + timedelta(minutes=1))
+
+    windows = agg.window_summary()
+    assert [row["window"] for row in windows] == [START, START + timedelta(minutes=1)]
+    assert [row["count"] for row in windows] == [2, 1]
+
+
+def test_oldest_window_evicted_past_max_windows():
+    agg = CSAnalyticsAggregator(max_windows=3)
+    for minute in range(5):
+        agg.add(make_interaction(1.0), recorded_at=START + timedelta(minutes=minute))
+
+    windows = [row["window"] for row in agg.window_summary()]
+    assert windows == [START + timedelta(minutes=m) for m in (2, 3, 4)]
+    assert agg.overall_summary()["count"] == 5
+
+
+def test_late_interaction_skips_evicted_window():
+    agg = CSAnalyticsAggregator(max_windows=2)
+    agg.add(make_interaction(1.0), recorded_at=START + timedelta(minutes=5))
+    agg.add(make_interaction(1.0), recorded_at=START + timedelta(minutes=6))
+    agg.add(make_interaction(1.0), recorded_at=START)
+
+    windows = [row["window"] for row in agg.window_summary()]
+    assert windows == [START + timedelta(minutes=5), START + timedelta(minutes=6)]
+    assert agg.overall_summary()["count"] == 3
+
+
+def test_recent_is_bounded():
+    agg = CSAnalyticsAggregator(max_recent=2)
+    for response_time in (1.0, 2.0, 3.0):
+        agg.add(make_interaction(response_time), recorded_at=START)
+
+    assert [i["response_time"] for i in agg.recent] == [2.0, 3.0]
+
+
+def test_len_counts_recorded_interactions():
+    agg = CSAnalyticsAggregator()
+    assert len(agg) == 0
+
+    agg.add(make_interaction(1.0), recorded_at=START)
+    agg.add(make_interaction(2.0), recorded_at=START)
+    assert len(agg) == 2